@@ -1,3 +1,4 @@
+import sys
 import time
 from random import randint
 from typing import List
@@ -8,6 +9,7 @@ import matplotlib.pyplot as plt
 from convex_hull import Point
 from convex_hull import base_case_hull
 from convex_hull import compute_hull
+from convex_hull import distance_to_hull
 import numpy as np
 
 
@@ -81,5 +83,41 @@ def run_benchmarks():
     # plt.savefig('benchmark_plot.png')
 
 
+def hull_error(approx_hull: List[Point], exact_hull: List[Point]) -> float:
+    """ Hausdorff distance between an approximate hull and the exact hull containing it.
+
+    The distance to a convex polygon is convex, so the maximum is attained at a vertex
+    of the exact hull. Approximate hulls that collapse to a point or a segment (eps wider
+    than the x-range) are measured as such.
+    """
+    return max(distance_to_hull(approx_hull, vertex) for vertex in exact_hull)
+
+
+def run_approx_benchmarks(n: int = 1_000_000, max_coord: int = 1_000_000):
+    """ Shows the speed/accuracy tradeoff of compute_hull(points, approx_eps=...).
+
+    Prints the running time and the measured error (which never exceeds eps) for a
+    range of eps values against the exact hull of the same points.
+    """
+    points = generate_points(n, max_x=max_coord, max_y=max_coord)
+
+    start_time = time.time()
+    exact_hull = compute_hull(list(points))
+    exact_time = time.time() - start_time
+    print(f'exact: time: {exact_time:.3f}s, hull size: {len(exact_hull)}')
+
+    for eps in [1, 10, 100, 1_000, 10_000, 100_000]:
+        start_time = time.time()
+        approx_hull = compute_hull(points, approx_eps=eps)
+        approx_time = time.time() - start_time
+        error = hull_error(approx_hull, exact_hull)
+        print(f'eps: {eps}, time: {approx_time:.3f}s, speedup: {exact_time / approx_time:.1f}x, '
+              f'hull size: {len(approx_hull)}, max error: {error:.2f}')
+
+
 if __name__ == '__main__':
-    run_benchmarks()
+    # python benchmarks.py --approx shows the approximate hull's speed/accuracy tradeoff
+    if '--approx' in sys.argv:
+        run_approx_benchmarks()
+    else:
+        run_benchmarks()
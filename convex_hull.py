@@ -1,12 +1,32 @@
 import math
 import sys
+from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import NamedTuple
+from typing import Optional
 from typing import Tuple
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, presort_points falls back to a comparison sort
+    np = None
+
 EPSILON = sys.float_info.epsilon
 Point = Tuple[int, int]
 
 
+class HullVerification(NamedTuple):
+    """
+    Result of verify_hull. ok is True if the hull is valid, otherwise reason describes the
+    first problem found, point is the offending point and edge the hull edge it violates.
+    """
+    ok: bool
+    reason: str = ''
+    point: Optional[Point] = None
+    edge: Optional[Tuple[Point, Point]] = None
+
+
 def y_intercept(p1: Point, p2: Point, x: int) -> float:
     """
     Given two points, p1 and p2, an x coordinate from a vertical line,
@@ -76,7 +96,211 @@ def clockwise_sort(points: List[Point]):
     return
 
 
-def compute_hull(points: List[Point]) -> List[Point]:
+def _relative_int64_coords(points: List[Point], origin: Point):
+    """
+    Returns the points as an (n, 2) int64 numpy array relative to origin, or None if numpy
+    is missing, a coordinate is not an integer, or a point is 2**30 or more away from
+    origin in either coordinate. Differences between the returned points are then below
+    2**31, so a cross product of two differences fits in an int64 without wrapping.
+    """
+    if np is None or not points:
+        return None
+    coords = np.array(points)
+    if coords.dtype.kind != 'i' or coords.ndim != 2 or coords.shape[1] != 2:
+        return None
+    ox, oy = origin
+    span = max(int(coords[:, 0].max()) - ox, ox - int(coords[:, 0].min()),
+               int(coords[:, 1].max()) - oy, oy - int(coords[:, 1].min()))
+    if span >= 2 ** 30:
+        return None
+    return coords - (ox, oy)
+
+
+def verify_hull(hull: List[Point], points: List[Point]) -> HullVerification:
+    """
+    Given a hull (as returned by compute_hull) and the points it was computed from, checks
+    that the hull is a valid convex hull of the points and returns a HullVerification.
+
+    - Every hull vertex must be one of the points.
+    - In O(h), every three consecutive vertices must form a strictly clockwise turn, and
+      the turns must add up to a single revolution (the polygon does not wind twice).
+    - Every point must lie inside the hull. With numpy, all points are located at once by
+      a binary search over the wedges fanning out from hull[0], giving O(n log h)
+      operations; each point is then checked against the one edge closing its wedge.
+      Otherwise every point is checked against every edge.
+
+    A point counts as outside an edge a->b when is_counter_clockwise(a, b, point) holds,
+    the same tolerance as the rest of this module. The vectorized search is only used for
+    integer points close enough to hull[0] for its int64 arithmetic to be exact; float or
+    widely spread points use the per-edge check. The first violating point in input
+    order is reported.
+    """
+    if not hull:
+        if not points:
+            return HullVerification(True)
+        return HullVerification(False, 'empty hull for non-empty points')
+
+    point_set = set(points)
+    for vertex in hull:
+        if vertex not in point_set:
+            return HullVerification(False, 'hull vertex is not an input point', vertex)
+
+    h = len(hull)
+    if h <= 2:
+        # Degenerate hull: a single point or a segment, every point must lie on it
+        a, b = hull[0], hull[-1]
+        if h == 2 and a == b:
+            return HullVerification(False, 'repeated hull vertex', b, (a, b))
+        for p in points:
+            on_line = collinear(a, b, p)
+            in_box = min(a[0], b[0]) <= p[0] <= max(a[0], b[0]) and min(a[1], b[1]) <= p[1] <= max(a[1], b[1])
+            if not (on_line and in_box):
+                return HullVerification(False, 'point outside degenerate hull', p, (a, b))
+        return HullVerification(True)
+
+    # Strict convexity and clockwise order, O(h)
+    total_turn = 0.0
+    for i in range(h):
+        a, b, c = hull[i - 2], hull[i - 1], hull[i]
+        if not is_clockwise(a, b, c):
+            return HullVerification(False, 'hull is not strictly convex and clockwise at vertex', b, (a, b))
+        ux, uy = b[0] - a[0], b[1] - a[1]
+        vx, vy = c[0] - b[0], c[1] - b[1]
+        total_turn += math.atan2(abs(ux * vy - uy * vx), ux * vx + uy * vy)
+    if total_turn > 3 * math.pi:
+        return HullVerification(False, 'hull winds around more than once')
+
+    coords = _relative_int64_coords(points, hull[0])
+    vertices = _relative_int64_coords(hull, hull[0])
+    if coords is None or vertices is None:
+        # Fallback: check every point against every edge with exact Python arithmetic
+        for p in points:
+            for i in range(h):
+                if is_counter_clockwise(hull[i - 1], hull[i], p):
+                    return HullVerification(False, 'point outside hull', p, (hull[i - 1], hull[i]))
+        return HullVerification(True)
+
+    # Coordinates are relative to v_0 = hull[0], so v_0 is the origin below.
+    # The module's clockwise order is counter-clockwise in the usual y-up orientation, so a
+    # point is inside when it is left of (or on) every edge: cross >= 0, up to tolerance.
+    xs, ys = coords[:, 0], coords[:, 1]
+
+    def fan_side(i):
+        # twice the signed area of v_0, v_i, p (positive when p is left of v_0 -> v_i)
+        return vertices[i, 0] * ys - vertices[i, 1] * xs
+
+    # Binary search for the wedge v_0, v_lo, v_lo+1 containing each point
+    lo = np.ones(len(points), dtype=np.intp)
+    hi = np.full(len(points), h - 1, dtype=np.intp)
+    while True:
+        active = hi - lo > 1
+        if not active.any():
+            break
+        mid = (lo + hi) // 2
+        left = vertices[mid, 0] * ys - vertices[mid, 1] * xs >= 0
+        lo = np.where(active & left, mid, lo)
+        hi = np.where(active & ~left, mid, hi)
+
+    # Each point is checked against the edge closing its wedge, or the two edges at v_0
+    # if it lies outside the fan altogether. The integer cross products are exact, so the
+    # module's EPSILON tolerance reduces to a sign test.
+    edge_start = lo.copy()
+    edge_start[fan_side(h - 1) > 0] = h - 1
+    edge_start[fan_side(1) < 0] = 0
+    edge_end = (edge_start + 1) % h
+    sx, sy = vertices[edge_start, 0] - xs, vertices[edge_start, 1] - ys
+    ex, ey = vertices[edge_end, 0] - xs, vertices[edge_end, 1] - ys
+    outside = np.flatnonzero(sx * ey - sy * ex < 0)
+    if len(outside):
+        i = outside[0]
+        edge = (hull[edge_start[i]], hull[edge_end[i]])
+        return HullVerification(False, 'point outside hull', points[i], edge)
+    return HullVerification(True)
+
+
+def presort_points(points: List[Point]) -> List[Point]:
+    """
+    Given a list of points, returns a new list of the unique points sorted by x and then y.
+
+    When numpy is available and every coordinate is an integer, each (x, y) pair is packed
+    into a single int64 key, (x - min_x) * (max_y - min_y + 1) + (y - min_y), which orders
+    exactly like the tuples. The keys are sorted and deduplicated as flat integers, then
+    unpacked. Float, mixed or unbounded data (keys that would not fit in an int64) falls
+    back to sorting the tuples by comparison.
+    """
+    if np is not None and len(points) > 1:
+        coords = np.array(points)
+        if coords.dtype.kind == 'i' and coords.ndim == 2 and coords.shape[1] == 2:
+            xs, ys = coords[:, 0], coords[:, 1]
+            min_x, min_y = int(xs.min()), int(ys.min())
+            span = int(ys.max()) - min_y + 1
+            if (int(xs.max()) - min_x + 1) * span < 2 ** 63:
+                keys = (xs - min_x) * span + (ys - min_y)
+                keys.sort()
+                # drop duplicates in the same pass over the sorted keys
+                keep = np.empty(len(keys), dtype=bool)
+                keep[0] = True
+                np.not_equal(keys[1:], keys[:-1], out=keep[1:])
+                sorted_xs, sorted_ys = np.divmod(keys[keep], span)
+                return list(zip((sorted_xs + min_x).tolist(), (sorted_ys + min_y).tolist()))
+
+    sorted_points = sorted(points)
+    return [p for i, p in enumerate(sorted_points) if i == 0 or p != sorted_points[i - 1]]
+
+
+def strip_candidates(points: Iterable[Point], eps: float) -> List[Point]:
+    """
+    Given an iterable of points and a strip width eps > 0, buckets the points into
+    vertical strips of width eps in a single streaming pass and keeps only the lowest
+    and highest point seen in each strip. Returns the (unique) kept points.
+
+    Error bound: let Q be the convex hull of the returned points. For every input
+    point p in strip c, the segment joining the lowest and highest points of strip c
+    lies inside Q and crosses the horizontal line through p within the strip, so p is
+    at most eps away (horizontally) from Q. The hull of the candidates is therefore
+    within eps of the true hull, and every one of its vertices is an input point.
+
+    Uses O(number of non-empty strips) memory, independent of the number of points.
+    """
+    lowest: Dict[int, Point] = {}
+    highest: Dict[int, Point] = {}
+    for p in points:
+        strip = math.floor(p[0] / eps)
+        low = lowest.get(strip)
+        if low is None:
+            lowest[strip] = highest[strip] = p
+        elif p[1] < low[1]:
+            lowest[strip] = p
+        elif p[1] > highest[strip][1]:
+            highest[strip] = p
+
+    candidates = set(lowest.values())
+    candidates.update(highest.values())
+    return list(candidates)
+
+
+def distance_to_hull(hull: List[Point], point: Point) -> float:
+    """
+    Given a hull in clockwise order and a point, returns the distance from the point to
+    the hull polygon, or 0 if the point is inside it. Hulls of one or two points are
+    treated as a point or a segment.
+    """
+    # a single point gives one zero-length edge, a segment gives the segment twice
+    edges = list(zip(hull, hull[1:] + hull[:1]))
+    if len(hull) >= 3 and not any(is_counter_clockwise(a, b, point) for a, b in edges):
+        return 0.0
+
+    def segment_distance(a: Point, b: Point) -> float:
+        dx, dy = b[0] - a[0], b[1] - a[1]
+        length_sq = dx * dx + dy * dy
+        t = 0.0 if length_sq == 0 else ((point[0] - a[0]) * dx + (point[1] - a[1]) * dy) / length_sq
+        t = max(0.0, min(1.0, t))
+        return math.hypot(point[0] - (a[0] + t * dx), point[1] - (a[1] + t * dy))
+
+    return min(segment_distance(a, b) for a, b in edges)
+
+
+def compute_hull(points: List[Point], approx_eps: Optional[float] = None) -> List[Point]:
     """
     Given a list of points, recursively computes the convex hull around those points
     by dividing the points into two halves, computing the hulls of the two halves, and
@@ -88,8 +312,8 @@ def compute_hull(points: List[Point]) -> List[Point]:
     Initialization:
         - At the start, the list of points on the hull is empty, so it does not contain
           any points that would invalidate the convex hull, so the invariant holds.
-        - The points are sorted by x and y coordinates, giving a total of 
-          O(nlogn) operations.
+        - The points are sorted by x and y coordinates and deduplicated (as packed integer
+          keys when possible, see presort_points), giving a total of O(nlogn) operations.
     Maintenance:
         - The points are recursively divided into two halves, left and right, and contains
           all the points that would be in or on the convex hull.
@@ -106,16 +330,28 @@ def compute_hull(points: List[Point]) -> List[Point]:
           list of points returned contains all of the points that make up the complete
           convex hull of all the sub-hulls, so the invariant holds.
         - The final set of points is sorted in clockwise order.
+
+    Approximate mode: if approx_eps is given, the points (any iterable) are first reduced
+    in one linear pass by strip_candidates, and the exact hull of the few remaining
+    candidates is returned. Every input point is then within approx_eps of the hull.
     """
+    if approx_eps is not None:
+        if approx_eps <= 0:
+            raise ValueError(f'approx_eps must be positive, got {approx_eps}')
+        return compute_hull(strip_candidates(points, approx_eps))
+
     # No further work needed, returns points in clockwise order
     if len(points) <= 1:
         return points
+
+    # Sort the points by x-coordinate, dropping duplicates
+    points = presort_points(points)
+    if len(points) > 1 and all(collinear(points[0], points[-1], p) for p in points):
+        # Only the endpoints of a segment are on its hull
+        return [points[0], points[-1]]
     if len(points) <= 3:
         clockwise_sort(points)
         return points
-    
-    # Sort the points by x-coordinate
-    points.sort()
 
     def divide_hull(points: List[Point]) -> List[Point]:
         if len(points) <= 6:
@@ -140,6 +376,105 @@ def compute_hull(points: List[Point]) -> List[Point]:
     return complete_hull
 
 
+def monotone_chain(points: List[Point]) -> List[Point]:
+    """
+    Given a list of points sorted by x and y (or in reverse), returns one half of their
+    convex hull using Andrew's monotone chain: the points are walked in order and only
+    strictly counter-clockwise turns are kept. Walking the sorted points gives the lower
+    half of the hull, walking them in reverse gives the upper half (see base_case_hull).
+    O(n) operations.
+    """
+    chain = []
+    for p in points:
+        while len(chain) >= 2 and not is_counter_clockwise(chain[-2], chain[-1], p):
+            chain.pop()
+        chain.append(p)
+    return chain
+
+
+def convex_layers(points: List[Point], max_layers: Optional[int] = None) -> List[List[Point]]:
+    """
+    Given a list of points, computes its nested convex layers (onion peeling): the first
+    layer is the convex hull of the points, the next is the hull of the points left after
+    removing the first layer's vertices, and so on. Each layer is returned in clockwise
+    order and is exactly what compute_hull would return for the remaining points, starting
+    at the same vertex.
+    If max_layers is given, peeling stops after that many layers.
+
+    The points are sorted and deduplicated once and cut into small blocks of consecutive
+    points. A binary tree over the blocks stores, for every node, the two monotone chains
+    of the points remaining in its segment of the sorted order, and a node's chains are
+    the monotone chains of its children's chains joined together. The root's chains form
+    the next layer. Peeling it only rebuilds the blocks that lost a point and their
+    ancestors, each from its children's (short) chains, instead of walking every
+    remaining point for every layer.
+    """
+    points = presort_points(points)
+    block_size = 8
+    num_blocks = max(1, -(-len(points) // block_size))
+    size = 1
+    while size < num_blocks:
+        size *= 2
+
+    # forward[k] walks node k's points left to right, backward[k] right to left
+    blocks = [points[i:i + block_size] for i in range(0, len(points), block_size)]
+    forward = [[] for _ in range(2 * size)]
+    backward = [[] for _ in range(2 * size)]
+
+    def rebuild(k: int):
+        if k >= size:
+            block = blocks[k - size] if k - size < len(blocks) else []
+            forward[k] = monotone_chain(block)
+            backward[k] = monotone_chain(block[::-1])
+        else:
+            forward[k] = monotone_chain(forward[2 * k] + forward[2 * k + 1])
+            backward[k] = monotone_chain(backward[2 * k + 1] + backward[2 * k])
+
+    for k in range(2 * size - 1, 0, -1):
+        rebuild(k)
+
+    block_of = {p: i // block_size for i, p in enumerate(points)}
+    remaining = len(points)
+    layers = []
+    while remaining and (max_layers is None or len(layers) < max_layers):
+        if remaining <= 2:
+            layer = [p for block in blocks for p in block]
+        else:
+            layer = forward[1][:-1] + backward[1][:-1]
+            if len(layer) == 2:
+                # a segment, ordered by x and y like compute_hull's endpoints
+                layer.sort()
+            else:
+                # same vertex order (and starting vertex) as compute_hull
+                clockwise_sort(layer)
+        layers.append(layer)
+        remaining -= len(layer)
+
+        # Remove the layer and rebuild the affected nodes, one tree level at a time
+        dirty = set()
+        for p in layer:
+            blocks[block_of[p]].remove(p)
+            dirty.add(size + block_of[p])
+        while dirty:
+            for k in dirty:
+                rebuild(k)
+            dirty = {k // 2 for k in dirty if k > 1}
+    return layers
+
+
+def convex_layer_ids(points: List[Point], max_layers: Optional[int] = None) -> List[Optional[int]]:
+    """
+    Given a list of points, returns the index of the convex layer (see convex_layers) each
+    input point belongs to, with 0 being the outer hull. Points that lie inside the last
+    peeled layer when max_layers stops early are given None.
+    """
+    layer_of = {}
+    for i, layer in enumerate(convex_layers(points, max_layers)):
+        for p in layer:
+            layer_of[p] = i
+    return [layer_of.get(p) for p in points]
+
+
 def base_case_hull(points: List[Point]) -> List[Point]:
     """
     Base case of the recursive algorithm. Given a sorted list of points that is 
@@ -170,20 +505,9 @@ def base_case_hull(points: List[Point]) -> List[Point]:
         - The lower and upper hulls form the complete convex hull without duplicates
           sorted in counter-clockwise order.
     """
-    # Build the lower hull 
-    lower = []
-    for p in points:
-        while len(lower) >= 2 and not is_counter_clockwise(lower[-2], lower[-1], p):
-            lower.pop()
-        lower.append(p)
-
-    # Build the upper hull
-    upper = []
-    for i in range(len(points) - 1, -1, -1):
-        p = points[i]
-        while len(upper) >= 2 and not is_counter_clockwise(upper[-2], upper[-1], p):
-            upper.pop()
-        upper.append(p)
+    # Build the lower hull left to right and the upper hull right to left
+    lower = monotone_chain(points)
+    upper = monotone_chain(points[::-1])
 
     # Concatenate lower and upper hull to make the full hull
     # Remove the last point of each half to avoid duplication
@@ -251,16 +575,23 @@ def find_tangents(left_hull: List[Point], right_hull: List[Point]) -> Tuple[Tupl
     def prev_index(hull, index):
         return (index - 1) % len(hull)
 
+    def extends(a, b, c):
+        # True if c lies on the line through a and b, beyond a (on the side away from b)
+        return collinear(a, b, c) and (c[0] - a[0]) * (a[0] - b[0]) + (c[1] - a[1]) * (a[1] - b[1]) > 0
+
     def find_tangent(left_hull, right_hull, left_point_idx, right_point_idx, traversal_f, next_f, prev_f):
         # Find the tangent by moving along the hulls until no more points can be added
         while True:
             moved = False
             # Move along the left hull until the next point is not counterclockwise
-            while traversal_f(left_hull[left_point_idx], right_hull[right_point_idx], left_hull[next_f(left_hull, left_point_idx)]):
+            # (or is collinear but further out, so the tangent ends on the extreme points)
+            while (traversal_f(left_hull[left_point_idx], right_hull[right_point_idx], left_hull[next_f(left_hull, left_point_idx)])
+                   or extends(left_hull[left_point_idx], right_hull[right_point_idx], left_hull[next_f(left_hull, left_point_idx)])):
                 left_point_idx = next_f(left_hull, left_point_idx)
                 moved = True
             # Move along the right hull in the opposite direction
-            while traversal_f(left_hull[left_point_idx], right_hull[right_point_idx], right_hull[prev_f(right_hull, right_point_idx)]):
+            while (traversal_f(left_hull[left_point_idx], right_hull[right_point_idx], right_hull[prev_f(right_hull, right_point_idx)])
+                   or extends(right_hull[right_point_idx], left_hull[left_point_idx], right_hull[prev_f(right_hull, right_point_idx)])):
                 right_point_idx = prev_f(right_hull, right_point_idx)
                 moved = True
             # If no points were added, the tangent is found
@@ -1,15 +1,23 @@
+import math
 import unittest
-from collections import deque
 from typing import List
 
 from hypothesis import given
 from hypothesis import strategies as st
 
 from convex_hull import Point
+from convex_hull import base_case_hull
 from convex_hull import clockwise_sort
 from convex_hull import compute_hull
+from convex_hull import distance_to_hull
+from convex_hull import convex_layer_ids
+from convex_hull import convex_layers
 from convex_hull import is_clockwise
 from convex_hull import is_counter_clockwise
+from convex_hull import merge_hulls
+from convex_hull import presort_points
+from convex_hull import strip_candidates
+from convex_hull import verify_hull
 from convex_hull import y_intercept
 
 
@@ -60,16 +68,20 @@ class TestGivenFunctions(unittest.TestCase):
 
 
 def is_convex_hull(hull: List[Point], points: List[Point]):
-    vertices = hull + [hull[0]]
-    prev_two = deque(maxlen=2)
-    for vertex in vertices:
-        prev_two.append(vertex)
-        if len(prev_two) == 2:
-            for point in points:
-                assert not is_counter_clockwise(*prev_two, point)
+    result = verify_hull(hull, points)
+    assert result.ok, result
     return True
 
 
+def brute_force_outside(hull: List[Point], points: List[Point]):
+    """The first point that is outside some hull edge, checking every edge (O(n*h))."""
+    for point in points:
+        for a, b in zip(hull, hull[1:] + hull[:1]):
+            if is_counter_clockwise(a, b, point):
+                return point
+    return None
+
+
 class TestComputeHull(unittest.TestCase):
     @given(st.lists(  # generate a list
         st.tuples(  # of 2-tuples
@@ -159,6 +171,251 @@ class TestComputeHull(unittest.TestCase):
         clockwise_sort(points)
         hull = compute_hull(points)
         self.assertTrue(is_convex_hull(hull, points))
-        
+
+    def test_only_duplicates(self):
+        points = [(2, 2), (2, 2), (2, 2), (2, 2), (2, 2)]
+        hull = compute_hull(points)
+        self.assertEqual(hull, [(2, 2)])
+
+    def test_three_collinear_points(self):
+        self.assertEqual(compute_hull([(0, 0), (1, 0), (2, 0)]), [(0, 0), (2, 0)])
+        self.assertEqual(compute_hull([(2, 4), (0, 0), (1, 2)]), [(0, 0), (2, 4)])
+
+    def test_many_collinear_points(self):
+        points = [(0, y) for y in range(10)]
+        self.assertEqual(compute_hull(points), [(0, 0), (0, 9)])
+
+    def test_tangent_along_collinear_points(self):
+        # Both tangents run along an edge of each hull, so the walks must continue
+        # past the collinear inner corners to reach the outer ones
+        left_hull = base_case_hull([(0, 0), (0, 2), (1, 1), (2, 0), (2, 2)])
+        right_hull = base_case_hull([(3, 0), (4, 1), (5, 0), (5, 2)])
+        self.assertCountEqual(merge_hulls(left_hull, right_hull), [(0, 0), (0, 2), (5, 2), (5, 0)])
+
+    def test_collinear_column_with_cluster(self):
+        points = [(0, y) for y in range(8)] + [(1, 0), (1, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+        hull = compute_hull(points)
+        self.assertCountEqual(hull, [(0, 0), (0, 7), (2, 2), (2, 0)])
+        self.assertTrue(is_convex_hull(hull, points))
+
+
+class TestPresortPoints(unittest.TestCase):
+    @given(st.lists(
+        st.tuples(
+            st.integers(min_value=-100_000, max_value=100_000),
+            st.integers(min_value=-100_000, max_value=100_000),
+        ),
+        max_size=1_000,
+    ))
+    def test_matches_tuple_sort(self, points):
+        self.assertEqual(presort_points(points), sorted(set(points)))
+
+    def test_returns_python_ints(self):
+        points = presort_points([(3, 1), (0, 2), (3, 1)])
+        self.assertEqual(points, [(0, 2), (3, 1)])
+        self.assertTrue(all(type(x) is int and type(y) is int for x, y in points))
+
+    def test_float_fallback(self):
+        points = [(1.5, 2), (0, 0.25), (1.5, 2), (1.5, -1)]
+        self.assertEqual(presort_points(points), [(0, 0.25), (1.5, -1), (1.5, 2)])
+
+    def test_unbounded_fallback(self):
+        points = [(2 ** 40, 0), (0, 2 ** 40), (-(2 ** 40), 5), (0, 2 ** 40)]
+        self.assertEqual(presort_points(points), sorted(set(points)))
+        points = [(2 ** 70, 1), (0, 0)]
+        self.assertEqual(presort_points(points), [(0, 0), (2 ** 70, 1)])
+
+
+class TestConvexLayers(unittest.TestCase):
+    @given(st.lists(
+        st.tuples(
+            st.integers(min_value=0, max_value=100),
+            st.integers(min_value=0, max_value=100),
+        ),
+        min_size=1,
+        max_size=500,
+    ))
+    def test_matches_repeated_hulls(self, points):
+        layers = convex_layers(points)
+        remaining = set(points)
+        for layer in layers:
+            self.assertEqual(layer, compute_hull(sorted(remaining)))
+            if len(layer) >= 3:
+                self.assertTrue(is_convex_hull(layer, list(remaining)))
+            remaining -= set(layer)
+        self.assertEqual(remaining, set())
+
+    def test_grid_matches_repeated_hulls(self):
+        points = [(x, y) for x in range(12) for y in range(9)]
+        remaining = list(points)
+        for layer in convex_layers(points):
+            self.assertEqual(layer, compute_hull(list(remaining)))
+            remaining = [p for p in remaining if p not in layer]
+        self.assertEqual(remaining, [])
+
+    def test_nested_squares(self):
+        points = [(0, 0), (0, 6), (6, 6), (6, 0), (1, 1), (1, 5), (5, 5), (5, 1), (3, 3)]
+        layers = convex_layers(points)
+        self.assertEqual(len(layers), 3)
+        self.assertCountEqual(layers[0], [(0, 0), (0, 6), (6, 6), (6, 0)])
+        self.assertCountEqual(layers[1], [(1, 1), (1, 5), (5, 5), (5, 1)])
+        self.assertEqual(layers[2], [(3, 3)])
+
+        test_points = layers[0] + layers[0][:2]
+        for i in range(len(layers[0])):
+            self.assertTrue(is_clockwise(*test_points[i:i + 3]))
+
+    def test_max_layers(self):
+        points = [(0, 0), (0, 6), (6, 6), (6, 0), (1, 1), (1, 5), (5, 5), (5, 1), (3, 3)]
+        self.assertEqual(len(convex_layers(points, max_layers=1)), 1)
+        self.assertEqual(convex_layers(points, max_layers=0), [])
+
+    def test_layer_ids(self):
+        points = [(3, 3), (0, 0), (0, 6), (6, 6), (6, 0), (1, 1), (1, 5), (5, 5), (5, 1), (0, 0)]
+        self.assertEqual(convex_layer_ids(points), [2, 0, 0, 0, 0, 1, 1, 1, 1, 0])
+        self.assertEqual(convex_layer_ids(points, max_layers=2), [None, 0, 0, 0, 0, 1, 1, 1, 1, 0])
+
+
+class TestVerifyHull(unittest.TestCase):
+    square = [(0, 0), (4, 0), (4, 4), (0, 4)]
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.integers(min_value=0, max_value=1_000),
+                st.integers(min_value=0, max_value=1_000),
+            ),
+            min_size=3,
+            max_size=200,
+            unique=True,
+        ),
+        st.lists(
+            st.tuples(
+                st.integers(min_value=-100, max_value=1_100),
+                st.integers(min_value=-100, max_value=1_100),
+            ),
+            max_size=200,
+        ),
+    )
+    def test_matches_brute_force(self, points, queries):
+        hull = compute_hull(list(points))
+        self.assertTrue(verify_hull(hull, points).ok)
+        if len(hull) < 3:
+            return
+        result = verify_hull(hull, hull + queries)
+        self.assertEqual(result.point, brute_force_outside(hull, hull + queries))
+        if not result.ok:
+            self.assertTrue(is_counter_clockwise(*result.edge, result.point))
+
+    def test_valid_square(self):
+        points = self.square + [(2, 2), (0, 2), (4, 1)]
+        self.assertEqual(verify_hull(self.square, points), (True, '', None, None))
+
+    def test_point_outside(self):
+        points = self.square + [(2, 2), (5, 2), (2, -1)]
+        result = verify_hull(self.square, points)
+        self.assertFalse(result.ok)
+        self.assertEqual(result.point, (5, 2))
+        self.assertEqual(result.edge, ((4, 0), (4, 4)))
+
+    def test_point_outside_fan(self):
+        result = verify_hull(self.square, self.square + [(-1, 2)])
+        self.assertEqual(result.point, (-1, 2))
+        self.assertEqual(result.edge, ((0, 4), (0, 0)))
+        result = verify_hull(self.square, self.square + [(2, 5)])
+        self.assertEqual(result.edge, ((4, 4), (0, 4)))
+
+    def test_counter_clockwise_hull(self):
+        result = verify_hull(self.square[::-1], self.square)
+        self.assertFalse(result.ok)
+
+    def test_collinear_vertex(self):
+        hull = [(0, 0), (4, 0), (4, 4), (2, 4), (0, 4)]
+        result = verify_hull(hull, hull)
+        self.assertFalse(result.ok)
+        self.assertEqual(result.point, (2, 4))
+
+    def test_winds_twice(self):
+        pentagram = [(0, 10), (6, -8), (-10, 3), (10, 3), (-6, -8)]
+        self.assertFalse(verify_hull(pentagram, pentagram).ok)
+
+    def test_vertex_not_in_points(self):
+        result = verify_hull(self.square, self.square[:3])
+        self.assertEqual(result.point, (0, 4))
+
+    def test_degenerate_hulls(self):
+        self.assertEqual(verify_hull([], []), (True, '', None, None))
+        self.assertFalse(verify_hull([], [(1, 1)]).ok)
+        self.assertTrue(verify_hull([(1, 1)], [(1, 1), (1, 1)]).ok)
+        self.assertTrue(verify_hull([(0, 0), (4, 4)], [(0, 0), (2, 2), (4, 4)]).ok)
+        self.assertFalse(verify_hull([(0, 0), (4, 4)], [(0, 0), (5, 5), (4, 4)]).ok)
+        self.assertFalse(verify_hull([(0, 0), (4, 4)], [(0, 0), (2, 3), (4, 4)]).ok)
+
+    def test_large_mixed_sign_coordinates(self):
+        # the first offset is the widest square checked in int64, the others fall back
+        for offset in [2 ** 29 - 1, 2 ** 29, 2 ** 31 - 1, 2 ** 52]:
+            hull = [(-offset, -offset), (offset, -offset), (offset, offset), (-offset, offset)]
+            inside = [(0, 0), (offset, 0), (offset - 1, 1 - offset), (1 - offset, offset)]
+            self.assertTrue(verify_hull(hull, hull + inside).ok)
+            result = verify_hull(hull, hull + inside + [(offset + 1, 0)])
+            self.assertEqual(result.point, (offset + 1, 0))
+            self.assertEqual(result.edge, ((offset, -offset), (offset, offset)))
+            probes = [(offset + dx, y) for dx in (-1, 0, 1) for y in (-offset, 0, offset - 1)]
+            self.assertEqual(verify_hull(hull, hull + probes).point, brute_force_outside(hull, probes))
+
+    def test_unbounded_fallback(self):
+        big = 2 ** 70
+        hull = [(0, 0), (big, 0), (big, big), (0, big)]
+        self.assertTrue(verify_hull(hull, hull + [(1, 1)]).ok)
+        self.assertEqual(verify_hull(hull, hull + [(big + 1, 1)]).point, (big + 1, 1))
+
+
+class TestApproxHull(unittest.TestCase):
+    @given(
+        st.lists(
+            st.tuples(
+                st.integers(min_value=0, max_value=100_000),
+                st.integers(min_value=0, max_value=100_000),
+            ),
+            min_size=3,
+            max_size=5_000,
+            unique=True,
+        ),
+        st.sampled_from([1, 10, 250, 5_000, 100_000]),
+    )
+    def test_error_bound(self, points, eps):
+        hull = compute_hull(list(points), approx_eps=eps)
+        self.assertTrue(set(hull) <= set(points))
+        for point in points:
+            self.assertLessEqual(distance_to_hull(hull, point), eps)
+
+    def test_small_eps_is_exact(self):
+        points = [(0, 0), (2, 3), (4, 0), (1, 1), (3, 1)]
+        hull = compute_hull(points, approx_eps=0.5)
+        self.assertCountEqual(hull, [(0, 0), (4, 0), (2, 3)])
+
+    def test_accepts_iterator(self):
+        points = [(x, (x * 37) % 101) for x in range(1_000)]
+        hull = compute_hull(iter(points), approx_eps=50)
+        for point in points:
+            self.assertLessEqual(distance_to_hull(hull, point), 50)
+
+    def test_strip_candidates_keeps_extremes(self):
+        points = [(0, 5), (1, 0), (1, 9), (2, 4), (3, 7), (3, 1)]
+        self.assertCountEqual(strip_candidates(points, 2), [(1, 0), (1, 9), (3, 7), (3, 1)])
+
+    def test_distance_to_collapsed_hull(self):
+        points = [(0, 0), (10, 0), (5, 10)]
+        hull = compute_hull(points, approx_eps=100)
+        self.assertEqual(hull, [(0, 0), (5, 10)])
+        self.assertAlmostEqual(distance_to_hull(hull, (10, 0)), math.sqrt(80))
+        self.assertAlmostEqual(distance_to_hull([(1, 1)], (4, 5)), 5.0)
+        self.assertEqual(distance_to_hull(points, (5, 1)), 0.0)
+
+    def test_invalid_eps(self):
+        with self.assertRaises(ValueError):
+            compute_hull([(0, 0), (1, 1), (2, 0)], approx_eps=0)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file